@@ -2,17 +2,42 @@
 
 from __future__ import annotations
 
+import atexit
+import contextlib
 import json
+import os
+import queue
+import threading
+from collections import deque
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 
 from safeclaw.redaction import redact
 
+try:  # Optional fast path: orjson serializes/parses several times faster.
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
 AUDIT_DIR = ".safeclaw"
 AUDIT_FILE = "audit.jsonl"
 
 
+def _dumps_line(record: dict) -> bytes:
+    """Serialize a record to one JSONL line as UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _loads(line: str | bytes) -> dict:
+    """Parse one JSONL line."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
 @dataclass
 class AuditEvent:
     """A single audit log entry."""
@@ -23,6 +48,74 @@ class AuditEvent:
     touched_files: list[str] = field(default_factory=list)
 
 
+# Resolved audit log paths keyed by the raw project_root argument.
+# Path.resolve() hits the filesystem (realpath); caching it keeps the
+# per-event cost to a dict lookup. Callers pass stable roots (from
+# Policy.root_path() or CLI arguments), so the cache stays tiny.
+_AUDIT_PATHS: dict[str, Path] = {}
+
+
+def _as_abs(p: Path | str) -> Path:
+    """Return *p* as an absolute path, resolving only when needed.
+
+    Callers usually pass Policy.root_path(), which is already absolute;
+    skipping resolve() avoids a realpath syscall chain per call.
+    """
+    if isinstance(p, Path) and p.is_absolute():
+        return p
+    return Path(p).resolve()
+
+
+def _audit_path(project_root: Path | str) -> Path:
+    """Return the audit log path for *project_root* (cached)."""
+    key = os.fspath(project_root)
+    path = _AUDIT_PATHS.get(key)
+    if path is None:
+        path = _as_abs(project_root) / AUDIT_DIR / AUDIT_FILE
+        _AUDIT_PATHS[key] = path
+    return path
+
+
+def _serialize(event: AuditEvent) -> bytes:
+    """Serialize an event to a redacted, timestamped JSONL line."""
+    record = asdict(event)
+    record["detail"] = redact(record["detail"])
+    record["timestamp"] = datetime.now(UTC).isoformat()
+    return _dumps_line(record)
+
+
+# Cached O_APPEND file descriptors, one per audit log. Reusing the fd
+# skips TextIOWrapper construction and the open/close syscalls per
+# event; POSIX guarantees O_APPEND writes of one line are atomic.
+_AUDIT_FDS: dict[Path, int] = {}
+_AUDIT_FD_LOCK = threading.Lock()
+
+
+def _get_audit_fd(audit_path: Path) -> int:
+    """Return a cached append-mode fd for *audit_path*, opening once."""
+    fd = _AUDIT_FDS.get(audit_path)
+    if fd is None:
+        with _AUDIT_FD_LOCK:
+            fd = _AUDIT_FDS.get(audit_path)
+            if fd is None:
+                audit_path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(audit_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+                _AUDIT_FDS[audit_path] = fd
+    return fd
+
+
+def _close_audit_fds() -> None:
+    """Close all cached audit log descriptors (registered via atexit)."""
+    with _AUDIT_FD_LOCK:
+        for fd in _AUDIT_FDS.values():
+            with contextlib.suppress(OSError):
+                os.close(fd)
+        _AUDIT_FDS.clear()
+
+
+atexit.register(_close_audit_fds)
+
+
 def write_audit(project_root: Path | str, event: AuditEvent) -> Path:
     """Append an audit event to the project's audit log.
 
@@ -36,24 +129,123 @@ def write_audit(project_root: Path | str, event: AuditEvent) -> Path:
     Returns:
         Path to the audit log file.
     """
-    root = Path(project_root).resolve()
-    audit_dir = root / AUDIT_DIR
-    audit_dir.mkdir(parents=True, exist_ok=True)
-    audit_path = audit_dir / AUDIT_FILE
+    audit_path = _audit_path(project_root)
+    os.write(_get_audit_fd(audit_path), _serialize(event))
+    return audit_path
 
-    record = asdict(event)
-    record["detail"] = redact(record["detail"])
-    record["timestamp"] = datetime.now(UTC).isoformat()
 
-    with audit_path.open("a", encoding="utf-8") as fh:
-        fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+class AuditWriter:
+    """Background writer that batches audit events into single writes.
 
-    return audit_path
+    High-traffic callers (the dashboard) enqueue events instead of
+    paying an open/write/close cycle per event; a daemon thread drains
+    the queue and groups pending events by log file so many small
+    appends collapse into one write. Events are flushed at least every
+    ``interval`` seconds and on interpreter exit.
+    """
+
+    def __init__(self, interval: float = 0.2) -> None:
+        self._interval = interval
+        self._queue: queue.SimpleQueue[tuple[Path, bytes]] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, project_root: Path | str, event: AuditEvent) -> None:
+        """Queue an audit event for asynchronous writing.
+
+        The record is redacted and timestamped immediately (at enqueue
+        time), only the file write is deferred.
+        """
+        self._ensure_thread()
+        self._queue.put((_audit_path(project_root), _serialize(event)))
+
+    def flush(self) -> None:
+        """Synchronously write out all currently queued events."""
+        with self._lock:
+            self._drain()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="safeclaw-audit-writer", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=self._interval)
+            except queue.Empty:
+                continue
+            with self._lock:
+                self._drain(first)
+
+    def _drain(self, first: tuple[Path, bytes] | None = None) -> None:
+        """Write all queued events, grouped by target file."""
+        pending: dict[Path, list[bytes]] = {}
+        if first is not None:
+            pending.setdefault(first[0], []).append(first[1])
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            pending.setdefault(item[0], []).append(item[1])
+
+        for path, lines in pending.items():
+            os.write(_get_audit_fd(path), b"".join(lines))
+
+
+_AUDIT_WRITER = AuditWriter()
+
+
+def get_audit_writer() -> AuditWriter:
+    """Return the process-wide batched audit writer."""
+    return _AUDIT_WRITER
+
+
+# Chunk size for reading the audit log backwards.
+_TAIL_CHUNK_SIZE = 64 * 1024
+
+
+def _read_tail_lines(audit_path: Path, last_n: int) -> tuple[list[str], int]:
+    """Read the last *last_n* non-empty lines of a file.
+
+    Seeks to the end and reads backward in fixed-size chunks, so the
+    amount of I/O is proportional to the requested tail rather than the
+    full (append-only, potentially large) log file. Also returns the
+    end offset the read covered, so callers tracking a resume position
+    stay consistent with what was actually consumed even if the file
+    grows mid-read.
+    """
+    fragments: deque[bytes] = deque()
+    newlines = 0
+
+    with audit_path.open("rb") as fh:
+        end = pos = fh.seek(0, os.SEEK_END)
+        while pos > 0 and newlines <= last_n:
+            read_size = min(_TAIL_CHUNK_SIZE, pos)
+            pos -= read_size
+            fh.seek(pos)
+            chunk = fh.read(read_size)
+            fragments.appendleft(chunk)
+            newlines += chunk.count(b"\n")
+
+    tail = b"".join(fragments).decode("utf-8", errors="replace")
+    lines = [line for line in tail.splitlines() if line.strip()]
+    return lines[-last_n:], end
 
 
 def read_audit(project_root: Path | str, last_n: int = 20) -> list[dict]:
     """Read the most recent *last_n* entries from the audit log.
 
+    Only the tail of the log is read, so reads stay cheap even for
+    long-lived append-only logs.
+
     Args:
         project_root: Root of the project.
         last_n: How many entries to return (most recent first).
@@ -61,10 +253,80 @@ def read_audit(project_root: Path | str, last_n: int = 20) -> list[dict]:
     Returns:
         A list of dicts, newest first.
     """
-    audit_path = Path(project_root).resolve() / AUDIT_DIR / AUDIT_FILE
-    if not audit_path.exists():
+    audit_path = _as_abs(project_root) / AUDIT_DIR / AUDIT_FILE
+    if not audit_path.exists() or last_n <= 0:
         return []
 
-    lines = audit_path.read_text(encoding="utf-8").strip().splitlines()
-    entries = [json.loads(line) for line in lines if line.strip()]
-    return list(reversed(entries[-last_n:]))
+    entries = [_loads(line) for line in _read_tail_lines(audit_path, last_n)[0]]
+    return list(reversed(entries))
+
+
+# Maximum number of parsed entries the tail cache keeps per log file.
+_TAIL_CACHE_MAXLEN = 1024
+
+
+@dataclass
+class _AuditTailCache:
+    """Parsed tail of one audit log plus the file offset it covers."""
+
+    size: int = 0
+    ring: deque[dict] = field(default_factory=lambda: deque(maxlen=_TAIL_CACHE_MAXLEN))
+
+
+_TAIL_CACHES: dict[Path, _AuditTailCache] = {}
+_TAIL_CACHE_LOCK = threading.Lock()
+
+
+def read_audit_cached(project_root: Path | str, last_n: int = 20) -> list[dict]:
+    """Like :func:`read_audit`, but incremental across calls.
+
+    Keeps a ring buffer of recently parsed entries per log file and only
+    parses bytes appended since the previous call, so repeated reads
+    (the dashboard polls on every page render) cost O(new bytes) instead
+    of O(tail). Falls back to a full tail re-read if the file shrank
+    (e.g. rotation) or more entries are requested than the cache holds.
+
+    Args:
+        project_root: Root of the project.
+        last_n: How many entries to return (most recent first).
+
+    Returns:
+        A list of dicts, newest first.
+    """
+    audit_path = _audit_path(project_root)
+    if last_n > _TAIL_CACHE_MAXLEN:
+        return read_audit(project_root, last_n)
+
+    with _TAIL_CACHE_LOCK:
+        try:
+            size = audit_path.stat().st_size
+        except OSError:
+            _TAIL_CACHES.pop(audit_path, None)
+            return []
+
+        cache = _TAIL_CACHES.setdefault(audit_path, _AuditTailCache())
+
+        if size < cache.size:
+            # File was truncated or rotated; start over.
+            cache.size = 0
+            cache.ring.clear()
+
+        if size > cache.size:
+            # The cached offset must match the bytes actually consumed:
+            # the batched AuditWriter can append between the stat above
+            # and the read, and an unbounded read would parse those
+            # entries now and again on the next call.
+            if cache.size == 0:
+                # Cold cache: parse only the most recent entries.
+                new_lines, consumed = _read_tail_lines(audit_path, _TAIL_CACHE_MAXLEN)
+            else:
+                with audit_path.open("rb") as fh:
+                    fh.seek(cache.size)
+                    suffix = fh.read(size - cache.size).decode("utf-8", errors="replace")
+                new_lines = [line for line in suffix.splitlines() if line.strip()]
+                consumed = size
+            cache.ring.extend(_loads(line) for line in new_lines)
+            cache.size = consumed
+
+        tail = list(cache.ring)[-last_n:] if last_n else []
+        return list(reversed(tail))
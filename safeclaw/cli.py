@@ -11,8 +11,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from safeclaw.audit import read_audit
-from safeclaw.policy import load_policy
-from safeclaw.runner import run_plan, run_plugin
+from safeclaw.policy import load_policy, load_policy_header
 
 app = typer.Typer(
     name="safeclaw",
@@ -31,6 +30,10 @@ PolicyOption = Annotated[
 
 def _run_and_display(policy_path: Path, plugin: str, target: Path) -> None:
     """Load policy, run a plugin, and display the result."""
+    # Deferred so commands that never execute a plugin (audit, policy)
+    # skip importing the runner and every plugin module behind it.
+    from safeclaw.runner import run_plugin
+
     policy = load_policy(policy_path)
     result = run_plugin(policy, plugin, target)
     if result.ok:
@@ -96,8 +99,11 @@ def audit(
     count: Annotated[int, typer.Option("--count", "-n", help="Number of entries")] = 20,
 ) -> None:
     """Show recent audit log entries."""
-    pol = load_policy(policy)
-    entries = read_audit(pol.root_path(), last_n=count)
+    # Only the project root is needed to locate the log, so read just
+    # the top-level scalars instead of building the full Policy model.
+    header = load_policy_header(policy)
+    root = Path(str(header.get("project_root", "."))).resolve()
+    entries = read_audit(root, last_n=count)
 
     if not entries:
         console.print("[dim]No audit log entries found.[/dim]")
@@ -248,8 +254,13 @@ def plan_cmd(
         raise typer.Exit(code=1)
 
     # Execute
+    from safeclaw.runner import run_plan, run_plan_parallel
+
     console.print("\n[bold]Executing plan...[/bold]\n")
-    results = run_plan(pol, exec_plan)
+    if pol.planner.parallel:
+        results = run_plan_parallel(pol, exec_plan)
+    else:
+        results = run_plan(pol, exec_plan)
 
     for i, (step, res) in enumerate(zip(exec_plan.steps, results, strict=False), start=1):
         icon = "[green]OK[/green]" if res.ok else "[red]FAIL[/red]"
@@ -2,19 +2,38 @@
 
 from __future__ import annotations
 
+import hmac
 import secrets
+import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import yaml
 from fastapi import Depends, FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
-from safeclaw.audit import AuditEvent, read_audit, write_audit
+from safeclaw.audit import AuditEvent, get_audit_writer, read_audit_cached
+from safeclaw.planner import Planner, PlannerError, validate_plan
 from safeclaw.policy import Policy
 from safeclaw.runner import get_registry, run_plugin
 
+try:  # Serialize JSON responses with orjson when the extra is installed.
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
+
+class _ORJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson's compiled serializer."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+_JSON_RESPONSE_CLASS: type[JSONResponse] = JSONResponse if orjson is None else _ORJSONResponse
+
 # ---------------------------------------------------------------------------
 # Token management
 # ---------------------------------------------------------------------------
@@ -28,7 +47,9 @@ def get_or_create_token(project_root: Path) -> str:
 
     Stored in ``.safeclaw/dashboard_token`` inside the project root.
     """
-    root = Path(project_root).resolve()
+    # root is typically Policy.root_path(), which is already absolute —
+    # skip the realpath syscalls in that case.
+    root = project_root if project_root.is_absolute() else Path(project_root).resolve()
     token_dir = root / TOKEN_DIR
     token_dir.mkdir(parents=True, exist_ok=True)
     token_path = token_dir / TOKEN_FILE
@@ -79,12 +100,16 @@ _NAV = """\
 """
 
 
+# Constant page chrome, assembled once at import time so each request
+# only concatenates the title and body into it.
+_PAGE_HEAD = "<!doctype html><html><head><title>"
+_PAGE_STYLE = f'</title><style>{_CSS}</style></head><body>{_NAV}<div class="container"><h1>'
+_PAGE_MID = "</h1>"
+_PAGE_SUFFIX = "</div></body></html>"
+
+
 def _page(title: str, body: str) -> str:
-    return (
-        f"<!doctype html><html><head><title>{title}</title>"
-        f"<style>{_CSS}</style></head><body>{_NAV}"
-        f'<div class="container"><h1>{title}</h1>{body}</div></body></html>'
-    )
+    return "".join((_PAGE_HEAD, title, _PAGE_STYLE, title, _PAGE_MID, body, _PAGE_SUFFIX))
 
 
 def _bool_pill(val: bool, yes: str = "yes", no: str = "no") -> str:
@@ -93,6 +118,48 @@ def _bool_pill(val: bool, yes: str = "yes", no: str = "no") -> str:
     return f'<span class="pill {cls}">{text}</span>'
 
 
+# Translation table for HTML escaping. str.translate is a single C-level
+# pass over the string, cheaper than chained .replace or html.escape for
+# the many small fields interpolated into each page.
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"})
+
+
+def _esc(s: str) -> str:
+    """Escape untrusted text for interpolation into HTML."""
+    return s.translate(_HTML_ESCAPE)
+
+
+# Row templates, parsed once at import time; rows are accumulated in a
+# list and joined so building a table is O(total length), not O(n^2)
+# repeated-concatenation.
+_AUDIT_ROW = '<tr><td>%s</td><td>%s</td><td class="%s">%s</td><td>%s</td></tr>'
+_PLUGIN_ROW = '<tr><td>{}</td><td class="{}">{}</td><td>{}</td></tr>'
+
+
+def _audit_row(e: dict, detail_limit: int) -> str:
+    """Render one audit entry as an HTML table row."""
+    # Well-formed entries (the overwhelming majority — we wrote them)
+    # take the direct-subscript path; one except clause covers records
+    # from hand-edited or truncated logs.
+    try:
+        ts = e["timestamp"][:19]
+        action = e["action"]
+        status = e["status"]
+        detail = e["detail"][:detail_limit]
+    except KeyError:
+        ts = e.get("timestamp", "?")[:19]
+        action = e.get("action", "?")
+        status = e.get("status", "?")
+        detail = e.get("detail", "")[:detail_limit]
+    cls = "ok" if status == "ok" else "error"
+    return _AUDIT_ROW % (_esc(ts), _esc(action), cls, _esc(status), _esc(detail))
+
+
+def _audit_rows(entries: list[dict], detail_limit: int) -> str:
+    """Render audit entries as concatenated HTML table rows."""
+    return "".join(_audit_row(e, detail_limit) for e in entries)
+
+
 # ---------------------------------------------------------------------------
 # App factory
 # ---------------------------------------------------------------------------
@@ -113,33 +180,59 @@ class PlanRequest(BaseModel):
 
 def create_app(policy: Policy) -> FastAPI:
     """Create and return the FastAPI dashboard application."""
-    app = FastAPI(title="SafeClaw Dashboard", docs_url=None, redoc_url=None)
+    app = FastAPI(
+        title="SafeClaw Dashboard",
+        docs_url=None,
+        redoc_url=None,
+        default_response_class=_JSON_RESPONSE_CLASS,
+    )
     token = get_or_create_token(policy.root_path())
+    # Dashboard audit events go through the batched background writer so
+    # each request does not pay a full open/write/close cycle.
+    audit_writer = get_audit_writer()
+
+    # Idempotent GETs are coalesced: a tab left open polling would
+    # otherwise append an audit record per refresh, growing the very log
+    # every page then has to re-read. Repeated identical GETs within the
+    # window are recorded once; mutating routes are always audited.
+    _GET_AUDIT_WINDOW = 5.0
+    recent_get_audits: dict[str, float] = {}
+
+    def audit_get(detail: str) -> None:
+        now = time.monotonic()
+        last = recent_get_audits.get(detail)
+        if last is not None and now - last < _GET_AUDIT_WINDOW:
+            return
+        recent_get_audits[detail] = now
+        audit_writer.enqueue(
+            policy.root_path(),
+            AuditEvent(action="dashboard", status="ok", detail=detail),
+        )
+
+    # The policy is immutable for the app's lifetime, so render its YAML
+    # view once here instead of paying PyYAML's pure-Python emitter on
+    # every /policy request.
+    policy_yaml = yaml.dump(policy.model_dump(), default_flow_style=False, sort_keys=False)
+    policy_yaml_html = f"<pre>{_esc(policy_yaml)}</pre>"
 
     # --- Auth dependency ---
+    # Precompute the expected header once; compare_digest is constant
+    # time (no short-circuit timing leak) and avoids building a new
+    # f-string per request.
+    expected_auth = f"Bearer {token}".encode("ascii")
+
     def require_auth(request: Request) -> None:
         auth = request.headers.get("Authorization", "")
-        if auth != f"Bearer {token}":
+        if not hmac.compare_digest(auth.encode("ascii", "ignore"), expected_auth):
             raise HTTPException(status_code=401, detail="Invalid or missing token")
 
     # --- Routes ---
 
     @app.get("/", response_class=HTMLResponse)
     def home(request: Request, _auth: None = Depends(require_auth)) -> str:
-        write_audit(
-            policy.root_path(),
-            AuditEvent(action="dashboard", status="ok", detail="GET /"),
-        )
-        entries = read_audit(policy.root_path(), last_n=10)
-        rows = ""
-        for e in entries:
-            ts = e.get("timestamp", "?")[:19]
-            cls = "ok" if e.get("status") == "ok" else "error"
-            rows += (
-                f"<tr><td>{ts}</td><td>{e.get('action', '?')}</td>"
-                f'<td class="{cls}">{e.get("status", "?")}</td>'
-                f"<td>{e.get('detail', '')[:80]}</td></tr>"
-            )
+        audit_get("GET /")
+        entries = read_audit_cached(policy.root_path(), last_n=10)
+        rows = _audit_rows(entries, detail_limit=80)
 
         net = _bool_pill(policy.allow_network, "allowed", "denied")
         sh = _bool_pill(policy.allow_shell, "allowed", "denied")
@@ -159,67 +252,58 @@ def create_app(policy: Policy) -> FastAPI:
         request: Request,
         page: int = 1,
         _auth: None = Depends(require_auth),
-    ) -> str:
-        write_audit(
-            policy.root_path(),
-            AuditEvent(action="dashboard", status="ok", detail="GET /audit"),
-        )
+    ) -> StreamingResponse:
+        audit_get("GET /audit")
         per_page = 20
-        entries = read_audit(policy.root_path(), last_n=page * per_page)
+        entries = read_audit_cached(policy.root_path(), last_n=page * per_page)
         start = (page - 1) * per_page
         page_entries = entries[start : start + per_page]
 
-        rows = ""
-        for e in page_entries:
-            ts = e.get("timestamp", "?")[:19]
-            cls = "ok" if e.get("status") == "ok" else "error"
-            rows += (
-                f"<tr><td>{ts}</td><td>{e.get('action', '?')}</td>"
-                f'<td class="{cls}">{e.get("status", "?")}</td>'
-                f"<td>{e.get('detail', '')[:100]}</td></tr>"
-            )
-
         nav_links = ""
         if page > 1:
             nav_links += f'<a href="/audit?page={page - 1}">&laquo; Previous</a> '
         if len(entries) >= page * per_page:
             nav_links += f'<a href="/audit?page={page + 1}">Next &raquo;</a>'
 
-        body = (
-            f"<table><tr><th>Time</th><th>Action</th><th>Status</th>"
-            f"<th>Detail</th></tr>{rows}</table>"
-            f"<p>{nav_links}</p>"
-        )
-        return _page("Audit Log", body)
+        # Stream the page chunk by chunk: the first bytes go out before
+        # all rows are formatted and peak memory stays at one row
+        # instead of the whole page.
+        def _gen() -> Iterator[str]:
+            title = "Audit Log"
+            yield _PAGE_HEAD + title + _PAGE_STYLE + title + _PAGE_MID
+            yield "<table><tr><th>Time</th><th>Action</th><th>Status</th><th>Detail</th></tr>"
+            for e in page_entries:
+                yield _audit_row(e, detail_limit=100)
+            yield f"</table><p>{nav_links}</p>"
+            yield _PAGE_SUFFIX
+
+        return StreamingResponse(_gen(), media_type="text/html")
 
     @app.get("/policy", response_class=HTMLResponse)
     def policy_page(request: Request, _auth: None = Depends(require_auth)) -> str:
-        write_audit(
-            policy.root_path(),
-            AuditEvent(action="dashboard", status="ok", detail="GET /policy"),
-        )
-        policy_dict = policy.model_dump()
-        formatted = yaml.dump(policy_dict, default_flow_style=False, sort_keys=False)
-        body = f"<pre>{formatted}</pre>"
-        return _page("Policy", body)
+        audit_get("GET /policy")
+        return _page("Policy", policy_yaml_html)
+
+    # The plugin registry only changes at startup, so sort it and render
+    # the full table (including docstring summaries) once here instead
+    # of per /plugins request.
+    registry = get_registry()
+    plugin_row_list: list[str] = []
+    for name in sorted(registry):
+        allowed = name in policy.allowed_plugins
+        cls = "enabled" if allowed else "disabled"
+        badge = _bool_pill(allowed)
+        doc = (registry[name].__doc__ or "").partition("\n")[0]
+        plugin_row_list.append(_PLUGIN_ROW.format(_esc(name), cls, badge, _esc(doc)))
+    plugins_body = (
+        "<table><tr><th>Plugin</th><th>Allowed</th><th>Description</th></tr>"
+        f"{''.join(plugin_row_list)}</table>"
+    )
 
     @app.get("/plugins", response_class=HTMLResponse)
     def plugins_page(request: Request, _auth: None = Depends(require_auth)) -> str:
-        write_audit(
-            policy.root_path(),
-            AuditEvent(action="dashboard", status="ok", detail="GET /plugins"),
-        )
-        registry = get_registry()
-        rows = ""
-        for name in sorted(registry):
-            allowed = name in policy.allowed_plugins
-            cls = "enabled" if allowed else "disabled"
-            badge = _bool_pill(allowed)
-            doc = (registry[name].__doc__ or "").split("\n")[0]
-            rows += f'<tr><td>{name}</td><td class="{cls}">{badge}</td><td>{doc}</td></tr>'
-
-        body = f"<table><tr><th>Plugin</th><th>Allowed</th><th>Description</th></tr>{rows}</table>"
-        return _page("Plugins", body)
+        audit_get("GET /plugins")
+        return _page("Plugins", plugins_body)
 
     @app.post("/run")
     def run_endpoint(
@@ -227,7 +311,7 @@ def create_app(policy: Policy) -> FastAPI:
         request: Request,
         _auth: None = Depends(require_auth),
     ) -> dict[str, Any]:
-        write_audit(
+        audit_writer.enqueue(
             policy.root_path(),
             AuditEvent(
                 action="dashboard",
@@ -249,13 +333,7 @@ def create_app(policy: Policy) -> FastAPI:
         request: Request,
         _auth: None = Depends(require_auth),
     ) -> dict[str, Any]:
-        from safeclaw.planner import (
-            Planner,
-            PlannerError,
-            validate_plan,
-        )
-
-        write_audit(
+        audit_writer.enqueue(
             policy.root_path(),
             AuditEvent(action="dashboard", status="ok", detail=f"POST /plan task={body.task}"),
         )
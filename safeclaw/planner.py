@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
+import functools
 import os
-import re
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from safeclaw.audit import AuditEvent, write_audit
 from safeclaw.policy import Policy
 
+try:  # httpx is an optional dependency (planner extra).
+    import httpx
+except ImportError:  # pragma: no cover - depends on installed extras
+    httpx = None  # type: ignore[assignment]
+
 # ---------------------------------------------------------------------------
 # Exceptions
 # ---------------------------------------------------------------------------
@@ -102,6 +108,32 @@ Rules:
 # ---------------------------------------------------------------------------
 
 
+def _require_httpx() -> None:
+    """Raise a clear error if the optional httpx dependency is missing."""
+    if httpx is None:
+        raise PlannerError(
+            "httpx is not installed. Install the 'planner' extra to use the LLM planner."
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client() -> httpx.Client:
+    """Return the shared HTTP client used by all planner backends.
+
+    A single pooled client keeps connections alive across calls, so
+    repeated planning requests reuse the TCP+TLS session instead of
+    paying a fresh handshake per call. Created lazily on the first
+    backend call and closed at interpreter exit.
+    """
+    _require_httpx()
+    client = httpx.Client(
+        timeout=60,
+        limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=60.0),
+    )
+    atexit.register(client.close)
+    return client
+
+
 def _get_api_key(policy: Policy) -> str:
     """Read the API key from the env var specified in policy."""
     env_var = policy.planner.api_key_env
@@ -110,13 +142,71 @@ def _get_api_key(policy: Policy) -> str:
     return os.environ.get(env_var, "")
 
 
-class _OllamaBackend:
-    """Send chat completions to a local Ollama instance."""
+class _BackendBase:
+    """Shared request plumbing for the LLM backends.
+
+    Subclasses describe their endpoint via ``_request`` / ``_extract``;
+    the sync and async transports live here so both paths share the
+    same error handling.
+    """
+
+    name = "LLM"
+
+    def _request(self, policy: Policy, system: str, user_msg: str) -> tuple[str, dict, dict]:
+        """Return (url, json payload, headers) for one planning call."""
+        raise NotImplementedError
+
+    def _extract(self, data: dict) -> str:
+        """Pull the assistant's text out of the response body."""
+        raise NotImplementedError
 
     def call(self, policy: Policy, system: str, user_msg: str) -> str:
-        """Send a request to Ollama's /api/chat endpoint."""
-        import httpx
+        """Send one planning request synchronously."""
+        # Before the try: with httpx missing the except clauses below
+        # would otherwise raise AttributeError instead of PlannerError.
+        _require_httpx()
+        url, payload, headers = self._request(policy, system, user_msg)
+        try:
+            resp = _get_client().post(url, json=payload, headers=headers)
+            resp.raise_for_status()
+            return self._extract(resp.json())
+        except httpx.ConnectError as exc:
+            raise PlanConnectionError(f"Cannot reach {self.name} at {url}: {exc}") from exc
+        except (httpx.HTTPStatusError, KeyError, IndexError) as exc:
+            raise PlanConnectionError(f"{self.name} request failed: {exc}") from exc
+
+    async def acall(
+        self, policy: Policy, system: str, user_msg: str, client: httpx.AsyncClient
+    ) -> str:
+        """Send one planning request on a shared async client."""
+        _require_httpx()
+        url, payload, headers = self._request(policy, system, user_msg)
+        try:
+            resp = await client.post(url, json=payload, headers=headers)
+            resp.raise_for_status()
+            return self._extract(resp.json())
+        except httpx.ConnectError as exc:
+            raise PlanConnectionError(f"Cannot reach {self.name} at {url}: {exc}") from exc
+        except (httpx.HTTPStatusError, KeyError, IndexError) as exc:
+            raise PlanConnectionError(f"{self.name} request failed: {exc}") from exc
+
+
+def _require_api_key(policy: Policy) -> str:
+    """Return the configured API key or raise with a helpful message."""
+    api_key = _get_api_key(policy)
+    if not api_key:
+        raise PlanConnectionError(
+            f"No API key found. Set the {policy.planner.api_key_env!r} environment variable."
+        )
+    return api_key
+
+
+class _OllamaBackend(_BackendBase):
+    """Send chat completions to a local Ollama instance."""
 
+    name = "Ollama"
+
+    def _request(self, policy: Policy, system: str, user_msg: str) -> tuple[str, dict, dict]:
         url = f"{policy.planner.base_url.rstrip('/')}/api/chat"
         payload = {
             "model": policy.planner.model,
@@ -127,30 +217,19 @@ class _OllamaBackend:
             "stream": False,
             "format": "json",
         }
-        try:
-            resp = httpx.post(url, json=payload, timeout=60)
-            resp.raise_for_status()
-            return resp.json()["message"]["content"]
-        except httpx.ConnectError as exc:
-            raise PlanConnectionError(f"Cannot reach Ollama at {url}: {exc}") from exc
-        except (httpx.HTTPStatusError, KeyError) as exc:
-            raise PlanConnectionError(f"Ollama request failed: {exc}") from exc
+        return url, payload, {}
 
+    def _extract(self, data: dict) -> str:
+        return data["message"]["content"]
 
-class _OpenAIBackend:
+
+class _OpenAIBackend(_BackendBase):
     """Send chat completions to the OpenAI API."""
 
-    def call(self, policy: Policy, system: str, user_msg: str) -> str:
-        """Send a request to OpenAI's chat completions endpoint."""
-        import httpx
+    name = "OpenAI"
 
-        api_key = _get_api_key(policy)
-        if not api_key:
-            raise PlanConnectionError(
-                f"No API key found. Set the {policy.planner.api_key_env!r} environment variable."
-            )
-        url = "https://api.openai.com/v1/chat/completions"
-        headers = {"Authorization": f"Bearer {api_key}"}
+    def _request(self, policy: Policy, system: str, user_msg: str) -> tuple[str, dict, dict]:
+        headers = {"Authorization": f"Bearer {_require_api_key(policy)}"}
         payload = {
             "model": policy.planner.model,
             "messages": [
@@ -159,31 +238,20 @@ class _OpenAIBackend:
             ],
             "temperature": 0.1,
         }
-        try:
-            resp = httpx.post(url, json=payload, headers=headers, timeout=60)
-            resp.raise_for_status()
-            return resp.json()["choices"][0]["message"]["content"]
-        except httpx.ConnectError as exc:
-            raise PlanConnectionError(f"Cannot reach OpenAI API: {exc}") from exc
-        except (httpx.HTTPStatusError, KeyError, IndexError) as exc:
-            raise PlanConnectionError(f"OpenAI request failed: {exc}") from exc
+        return "https://api.openai.com/v1/chat/completions", payload, headers
+
+    def _extract(self, data: dict) -> str:
+        return data["choices"][0]["message"]["content"]
 
 
-class _AnthropicBackend:
+class _AnthropicBackend(_BackendBase):
     """Send messages to the Anthropic API."""
 
-    def call(self, policy: Policy, system: str, user_msg: str) -> str:
-        """Send a request to Anthropic's messages endpoint."""
-        import httpx
+    name = "Anthropic"
 
-        api_key = _get_api_key(policy)
-        if not api_key:
-            raise PlanConnectionError(
-                f"No API key found. Set the {policy.planner.api_key_env!r} environment variable."
-            )
-        url = "https://api.anthropic.com/v1/messages"
+    def _request(self, policy: Policy, system: str, user_msg: str) -> tuple[str, dict, dict]:
         headers = {
-            "x-api-key": api_key,
+            "x-api-key": _require_api_key(policy),
             "anthropic-version": "2023-06-01",
             "content-type": "application/json",
         }
@@ -193,30 +261,29 @@ class _AnthropicBackend:
             "system": system,
             "messages": [{"role": "user", "content": user_msg}],
         }
-        try:
-            resp = httpx.post(url, json=payload, headers=headers, timeout=60)
-            resp.raise_for_status()
-            return resp.json()["content"][0]["text"]
-        except httpx.ConnectError as exc:
-            raise PlanConnectionError(f"Cannot reach Anthropic API: {exc}") from exc
-        except (httpx.HTTPStatusError, KeyError, IndexError) as exc:
-            raise PlanConnectionError(f"Anthropic request failed: {exc}") from exc
+        return "https://api.anthropic.com/v1/messages", payload, headers
 
+    def _extract(self, data: dict) -> str:
+        return data["content"][0]["text"]
 
-_BACKENDS: dict[str, type] = {
-    "ollama": _OllamaBackend,
-    "openai": _OpenAIBackend,
-    "anthropic": _AnthropicBackend,
+
+# Backends hold no per-policy state (URL, model and credentials are
+# read from the policy on every call, and the HTTP client is shared via
+# _get_client), so one instance per backend serves every planner.
+_BACKENDS: dict[str, _BackendBase] = {
+    "ollama": _OllamaBackend(),
+    "openai": _OpenAIBackend(),
+    "anthropic": _AnthropicBackend(),
 }
 
 
-def get_backend(policy: Policy) -> _OllamaBackend | _OpenAIBackend | _AnthropicBackend:
+def get_backend(policy: Policy) -> _BackendBase:
     """Return the appropriate backend instance for the policy."""
     name = policy.planner.backend
-    cls = _BACKENDS.get(name)
-    if cls is None:
+    backend = _BACKENDS.get(name)
+    if backend is None:
         raise PlannerError(f"Unknown planner backend: {name!r}")
-    return cls()
+    return backend
 
 
 # ---------------------------------------------------------------------------
@@ -233,21 +300,22 @@ def _parse_plan_json(raw: str) -> ExecutionPlan:
     if not text:
         raise PlanParseError("LLM returned an empty response.", raw_response=raw)
 
-    # Strip markdown code fences if present
-    text = re.sub(r"^```(?:json)?\s*", "", text)
-    text = re.sub(r"\s*```$", "", text)
-    text = text.strip()
+    # Strip markdown code fences if present; plain string operations
+    # cover the ```json ... ``` shape without any regex machinery.
+    if text.startswith("```"):
+        text = text[3:].removeprefix("json").lstrip()
+    if text.endswith("```"):
+        text = text[:-3].rstrip()
 
     try:
-        data = json.loads(text)
-    except json.JSONDecodeError as exc:
-        raise PlanParseError(f"Invalid JSON from LLM: {exc}", raw_response=raw) from exc
-
-    if not isinstance(data, dict) or "steps" not in data:
-        raise PlanParseError("LLM JSON missing 'steps' key.", raw_response=raw)
+        # Parse and validate in one pass; pydantic's JSON path skips the
+        # intermediate json.loads dict entirely.
+        plan = ExecutionPlan.model_validate_json(text)
+    except ValidationError as exc:
+        raise PlanParseError(f"Invalid plan from LLM: {exc}", raw_response=raw) from exc
 
-    steps = [PlanStep(**s) for s in data["steps"]]
-    return ExecutionPlan(steps=steps, raw_response=raw)
+    plan.raw_response = raw
+    return plan
 
 
 def validate_plan(plan: ExecutionPlan, policy: Policy) -> PlanResult:
@@ -267,18 +335,22 @@ def validate_plan(plan: ExecutionPlan, policy: Policy) -> PlanResult:
             rejected_steps=[f"Plan has {len(plan.steps)} steps (max {policy.planner.max_steps})"],
         )
 
-    root = policy.root_path()
+    # Containment here is a lexical pre-screen (normpath collapses any
+    # "..", no syscalls per step); the enforcing check stays in
+    # run_plugin, which resolve()s the real path - symlinks included -
+    # before anything executes.
+    root_str = os.fspath(policy.root_path())
+    prefix = root_str + os.sep
+    allowed = policy._allowed_set
     rejected: list[str] = []
 
     for step in plan.steps:
-        if step.plugin not in policy.allowed_plugins:
+        if step.plugin not in allowed:
             rejected.append(f"Plugin '{step.plugin}' is not allowed")
             continue
 
-        target = (root / step.target).resolve()
-        try:
-            target.relative_to(root)
-        except ValueError:
+        abs_target = os.path.normpath(os.path.join(root_str, step.target))
+        if abs_target != root_str and not abs_target.startswith(prefix):
             rejected.append(f"Target '{step.target}' is outside project root")
 
     return PlanResult(
@@ -306,6 +378,15 @@ class Planner:
 
     def __init__(self, policy: Policy) -> None:
         self._policy = policy
+        # The policy is immutable for the Planner's lifetime, so the
+        # system prompt can be rendered once instead of per plan() call.
+        self._system = _SYSTEM_PROMPT_TEMPLATE.format(
+            plugins=", ".join(policy.allowed_plugins),
+            root=policy.project_root,
+            network=policy.allow_network,
+            shell=policy.allow_shell,
+            max_steps=policy.planner.max_steps,
+        )
 
     def _check_enabled(self) -> None:
         """Raise if the planner cannot run under the current policy."""
@@ -336,14 +417,6 @@ class Planner:
         """
         self._check_enabled()
 
-        system = _SYSTEM_PROMPT_TEMPLATE.format(
-            plugins=", ".join(self._policy.allowed_plugins),
-            root=self._policy.project_root,
-            network=self._policy.allow_network,
-            shell=self._policy.allow_shell,
-            max_steps=self._policy.planner.max_steps,
-        )
-
         backend = get_backend(self._policy)
 
         write_audit(
@@ -351,7 +424,7 @@ class Planner:
             AuditEvent(action="planner", status="request", detail=f"Task: {task}"),
         )
 
-        raw = backend.call(self._policy, system, task)
+        raw = backend.call(self._policy, self._system, task)
         plan = _parse_plan_json(raw)
 
         write_audit(
@@ -364,3 +437,48 @@ class Planner:
         )
 
         return plan
+
+    async def plan_many(self, tasks: list[str], max_concurrency: int = 8) -> list[ExecutionPlan]:
+        """Generate execution plans for several tasks concurrently.
+
+        Sequential planning serializes one network round trip per task;
+        the calls are independent and IO-bound, so issuing them on a
+        shared async client with a concurrency cap overlaps the RTTs.
+
+        Args:
+            tasks: Task descriptions, one plan per task.
+            max_concurrency: Maximum number of in-flight LLM requests.
+
+        Returns:
+            Parsed plans in the same order as *tasks*.
+
+        Raises:
+            The same errors as :meth:`plan`, from the first failing task.
+        """
+        self._check_enabled()
+        _require_httpx()
+
+        backend = get_backend(self._policy)
+        root = self._policy.root_path()
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def one(task: str) -> ExecutionPlan:
+            async with sem:
+                write_audit(
+                    root, AuditEvent(action="planner", status="request", detail=f"Task: {task}")
+                )
+                raw = await backend.acall(self._policy, self._system, task, client)
+                plan = _parse_plan_json(raw)
+                write_audit(
+                    root,
+                    AuditEvent(
+                        action="planner",
+                        status="ok",
+                        detail=f"Generated {len(plan.steps)} step(s)",
+                    ),
+                )
+                return plan
+
+        limits = httpx.Limits(max_keepalive_connections=16, keepalive_expiry=60.0)
+        async with httpx.AsyncClient(timeout=60, limits=limits) as client:
+            return list(await asyncio.gather(*(one(t) for t in tasks)))
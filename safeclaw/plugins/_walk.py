@@ -0,0 +1,174 @@
+"""Shared directory walking and scanning helpers for the plugins.
+
+``sorted(target.rglob("*"))`` materializes every path in the tree and
+stats each one twice (``is_file`` plus the size check) before the
+``max_files`` cap can apply. This walker uses ``os.scandir``, whose
+DirEntry objects cache type and stat information from the directory
+read, and yields files incrementally so callers can stop early. Entries
+are sorted per directory, which keeps reports deterministic without the
+global O(N log N) sort over the whole tree.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+# Below this many files the executor's setup/dispatch overhead exceeds
+# any gain from overlapping reads, so scanning stays serial.
+_PARALLEL_THRESHOLD = 8
+
+# Directories pruned during traversal. VCS internals and dependency /
+# build caches contribute no signal but can hold hundreds of thousands
+# of files (.git/objects, node_modules) that eat the max_files budget
+# and dominate the stat() cost. .safeclaw is our own state directory.
+_SKIP_DIRS: frozenset[str] = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "node_modules",
+        ".venv",
+        "venv",
+        "__pycache__",
+        "dist",
+        "build",
+        ".tox",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".safeclaw",
+    }
+)
+
+
+def iter_files(root: Path) -> Iterator[tuple[Path, int]]:
+    """Yield ``(path, size_bytes)`` for regular files under *root*.
+
+    Traverses depth-first without following symlinks, pruning VCS and
+    cache directories (see ``_SKIP_DIRS``) at the directory level so
+    their contents are never stat'ed. Unreadable directories and
+    entries are skipped silently, matching the previous rglob-based
+    behaviour.
+
+    Args:
+        root: Directory to walk.
+
+    Yields:
+        Tuples of file path and size in bytes.
+    """
+    stack: list[str] = [str(root)]
+
+    while stack:
+        dirpath = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        subdirs: list[str] = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path), entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+
+        # Reversed so the stack pops subdirectories in name order.
+        stack.extend(reversed(subdirs))
+
+
+def is_scannable(
+    path: Path,
+    max_mb: int,
+    exts: set[str],
+    names: frozenset[str] = frozenset(),
+    size: int | None = None,
+) -> bool:
+    """Return True if the file should be scanned.
+
+    Args:
+        path: Candidate file.
+        max_mb: Size limit in megabytes.
+        exts: Lower-case file extensions considered scannable.
+        names: Lower-case full file names considered scannable (for
+            dotfiles like ``.env`` where ``Path.suffix`` is empty).
+        size: Known size in bytes (from the directory walk); when None
+            the file is stat'ed, for the single-file entry point.
+    """
+    if path.suffix.lower() not in exts and path.name.lower() not in names:
+        return False
+    try:
+        if size is None:
+            if not path.is_file():
+                return False
+            size = path.stat().st_size
+        return size / (1024 * 1024) <= max_mb
+    except OSError:
+        return False
+
+
+def collect_scannable(
+    target: Path,
+    max_mb: int,
+    max_files: int,
+    exts: set[str],
+    names: frozenset[str] = frozenset(),
+) -> list[Path]:
+    """Return the files to scan under *target*, honouring policy limits.
+
+    Handles both single-file and directory targets; directory walks
+    stop as soon as ``max_files`` candidates are collected.
+
+    Args:
+        target: File or directory being scanned.
+        max_mb: Size limit per file in megabytes.
+        max_files: Maximum number of files to collect.
+        exts: Lower-case extensions considered scannable.
+        names: Lower-case full file names considered scannable.
+
+    Returns:
+        Scannable files in walk order.
+    """
+    if target.is_file():
+        return [target] if is_scannable(target, max_mb, exts, names) else []
+
+    files: list[Path] = []
+    for p, size in iter_files(target):
+        if len(files) >= max_files:
+            break
+        if is_scannable(p, max_mb, exts, names, size):
+            files.append(p)
+    return files
+
+
+def scan_files(scan_one: Callable[[Path], _T], files: Sequence[Path]) -> list[_T]:
+    """Apply *scan_one* to every file, in parallel when worthwhile.
+
+    Per-file scanning is independent read-then-regex work; both
+    ``read_bytes`` and ``re`` release the GIL, so a thread pool overlaps
+    the I/O. ``Executor.map`` preserves input order, keeping plugin
+    output deterministic regardless of completion order.
+
+    Args:
+        scan_one: Function scanning a single file; must swallow its own
+            I/O errors (results are collected unconditionally).
+        files: Files to scan, in report order.
+
+    Returns:
+        One result per file, in the order of *files*.
+    """
+    if len(files) < _PARALLEL_THRESHOLD:
+        return [scan_one(f) for f in files]
+    max_workers = min(32, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(scan_one, files))
@@ -18,8 +18,8 @@ following signature::
 To register a new plugin:
 
 1. Create a module in ``safeclaw/plugins/`` with a ``run`` function.
-2. Add the plugin name (module filename without ``.py``) to the registry
-   in ``safeclaw/runner.py`` inside ``_register_builtins()``.
+2. Add the plugin name (module filename without ``.py``) to
+   ``_PLUGIN_REGISTRY`` in ``safeclaw/runner.py``.
 3. Add the plugin name to ``allowed_plugins`` in ``policy.yaml``.
 """
 
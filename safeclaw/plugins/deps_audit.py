@@ -2,42 +2,68 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import tomllib
 from pathlib import Path
 
 from safeclaw.policy import Policy
 
+# Compiled once at import; these run per dependency line.
+_DEP_SPEC_RE = re.compile(r"^([A-Za-z0-9_\-\.]+)\s*(.*)")
+_PIN_ZERO_RE = re.compile(r"==\s*0(?:\.|$)")
+
+# One multiline pass over requirements.txt: the lookahead drops blank,
+# comment, and option (-r/-e/...) lines, mirroring the per-line
+# strip/startswith filtering this replaces. Bytes mode so the file is
+# scanned undecoded; only the matched name/spec slices are decoded.
+_REQ_LINE_RE = re.compile(rb"(?m)^(?![ \t]*(?:#|-|\r?$))[ \t]*([A-Za-z0-9_\-.]+)[ \t]*([^\r\n]*)")
+
 
 def _parse_requirements_txt(path: Path) -> list[tuple[str, str]]:
     """Parse a requirements.txt file into (name, specifier) pairs."""
+    data = path.read_bytes()
+    return [
+        (m[1].decode("utf-8", "replace"), m[2].decode("utf-8", "replace").strip())
+        for m in _REQ_LINE_RE.finditer(data)
+    ]
+
+
+@functools.lru_cache(maxsize=16)
+def _pyproject_deps_cached(path_str: str, mtime_ns: int) -> tuple[tuple[str, str], ...]:
+    """Parse pyproject.toml dependencies, memoized per (path, mtime).
+
+    The mtime in the key invalidates the entry when the file changes,
+    the same stat-then-reuse scheme load_policy uses. Stored as a tuple
+    so cached results stay immutable.
+    """
+    try:
+        with open(path_str, "rb") as fh:
+            data = tomllib.load(fh)
+    except (tomllib.TOMLDecodeError, OSError):
+        return ()
+
+    specs = data.get("project", {}).get("dependencies", [])
     deps: list[tuple[str, str]] = []
-    for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#") or line.startswith("-"):
-            continue
-        match = re.match(r"^([A-Za-z0-9_\-\.]+)\s*(.*)", line)
+    for spec in specs:
+        match = _DEP_SPEC_RE.match(spec)
         if match:
             deps.append((match.group(1), match.group(2).strip()))
-    return deps
+    return tuple(deps)
 
 
 def _parse_pyproject_toml(path: Path) -> list[tuple[str, str]]:
-    """Extract dependency names/specifiers from pyproject.toml."""
-    deps: list[tuple[str, str]] = []
-    in_deps = False
-    for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
-        stripped = line.strip()
-        if stripped == "dependencies = [":
-            in_deps = True
-            continue
-        if in_deps:
-            if stripped == "]":
-                break
-            # Lines look like: "typer>=0.12.0",
-            match = re.match(r'"([A-Za-z0-9_\-\.]+)\s*(.*?)"', stripped)
-            if match:
-                deps.append((match.group(1), match.group(2).strip().rstrip(",")))
-    return deps
+    """Extract dependency names/specifiers from pyproject.toml.
+
+    Uses the stdlib C-based TOML parser, which handles multiline
+    arrays, inline comments, and quoting that the previous line-based
+    scan could not. Repeated calls on an unchanged file cost one stat.
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return []
+    return list(_pyproject_deps_cached(str(path), mtime_ns))
 
 
 def run(policy: Policy, target: Path) -> tuple[str, list[str]]:
@@ -79,9 +105,9 @@ def run(policy: Policy, target: Path) -> tuple[str, list[str]]:
 
     for name, spec in deps:
         parts.append(f"  {name} {spec}")
-        # Basic heuristic: flag exact pins to 0.x or very old-looking versions
-        pin_match = re.match(r"==\s*(\d+)", spec)
-        if pin_match and int(pin_match.group(1)) == 0:
+        # Basic heuristic: flag exact pins to 0.x or very old-looking versions.
+        # The substring check prefilters; most specs contain no "==" at all.
+        if "==" in spec and _PIN_ZERO_RE.match(spec):
             warnings.append(f"  {name} {spec} — pinned to 0.x (may be outdated)")
 
     if warnings:
@@ -7,7 +7,18 @@ from pathlib import Path
 
 from safeclaw.policy import Policy
 
-_ERROR_RE = re.compile(r"\b(error|exception|failed|traceback)\b", re.IGNORECASE)
+try:  # Optional fast path: RE2 matches with a DFA instead of backtracking.
+    import re2 as _re
+except ImportError:  # pragma: no cover - depends on installed extras
+    _re = re  # type: ignore[assignment]
+
+# Matches a whole log line containing an error keyword; (?m) makes one
+# finditer call scan every line of the file in a single C-level pass,
+# so clean lines never become Python objects at all.
+_ERROR_LINE_RE = _re.compile(rb"(?im)^.*\b(error|exception|failed|traceback)\b.*$")
+
+# How many notable lines the summary shows verbatim.
+_MAX_SHOWN = 20
 
 
 def run(policy: Policy, target: Path) -> tuple[str, list[str]]:
@@ -27,25 +38,39 @@ def run(policy: Policy, target: Path) -> tuple[str, list[str]]:
     if size_mb > policy.limits.max_file_mb:
         return f"File too large ({size_mb:.1f} MB, limit {policy.limits.max_file_mb} MB)", []
 
+    # The max_file_mb gate above bounds the read, so holding the file
+    # once is fine; only the lines actually shown are decoded.
     try:
-        lines = target.read_text(encoding="utf-8", errors="replace").splitlines()
+        data = target.read_bytes()
     except OSError as exc:
         return f"Could not read file: {exc}", []
 
-    total = len(lines)
-    error_lines: list[str] = []
+    total = data.count(b"\n")
+    if data and not data.endswith(b"\n"):
+        total += 1
 
-    for lineno, line in enumerate(lines, start=1):
-        if _ERROR_RE.search(line):
-            error_lines.append(f"  L{lineno}: {line.strip()}")
+    shown: list[str] = []
+    extra = 0
+    lineno = 1
+    prev = 0
+    for m in _ERROR_LINE_RE.finditer(data):
+        # Line numbers advance by the newlines since the last match —
+        # incremental counts instead of an O(n) count per match.
+        lineno += data.count(b"\n", prev, m.start())
+        prev = m.start()
+        if len(shown) < _MAX_SHOWN:
+            text = m.group(0).decode("utf-8", errors="replace").strip()
+            shown.append(f"  L{lineno}: {text}")
+        else:
+            extra += 1
 
     parts: list[str] = [f"Log: {target.name} ({total} lines total)"]
 
-    if error_lines:
-        parts.append(f"Found {len(error_lines)} notable line(s):")
-        parts.extend(error_lines[:20])
-        if len(error_lines) > 20:
-            parts.append(f"  ... and {len(error_lines) - 20} more")
+    if shown:
+        parts.append(f"Found {len(shown) + extra} notable line(s):")
+        parts.extend(shown)
+        if extra:
+            parts.append(f"  ... and {extra} more")
     else:
         parts.append("No errors/exceptions/failures detected.")
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections import Counter
 from pathlib import Path
 
+from safeclaw.plugins._walk import iter_files, scan_files
 from safeclaw.policy import Policy
 
 # Extensions treated as text/code for line counting.
@@ -43,6 +44,32 @@ _CODE_EXTENSIONS: set[str] = {
 }
 
 
+# Read granularity for line counting; 1 MiB keeps memory flat on files
+# near the max_file_mb limit while still amortizing the read syscalls.
+_COUNT_CHUNK = 1 << 20
+
+
+def _count_lines(path: Path) -> int:
+    """Count lines in *path* with a chunked newline scan.
+
+    Each chunk is scanned by bytes.count (a single memchr pass), so
+    peak memory stays at one chunk no matter the file size. A trailing
+    partial line still counts; unreadable files count as 0.
+    """
+    lines = 0
+    last = b"\n"
+    try:
+        with path.open("rb") as fh:
+            while chunk := fh.read(_COUNT_CHUNK):
+                lines += chunk.count(b"\n")
+                last = chunk[-1:]
+    except OSError:
+        return 0
+    if last != b"\n":
+        lines += 1
+    return lines
+
+
 def run(policy: Policy, target: Path) -> tuple[str, list[str]]:
     """Gather repository statistics for the directory at *target*.
 
@@ -60,29 +87,26 @@ def run(policy: Policy, target: Path) -> tuple[str, list[str]]:
     max_files = policy.limits.max_files
 
     ext_counts: Counter[str] = Counter()
-    total_lines = 0
     total_files = 0
     touched: list[str] = []
+    code_files: list[Path] = []
 
-    for p in sorted(target.rglob("*")):
+    for p, size in iter_files(target):
         if total_files >= max_files:
             break
-        if not p.is_file():
-            continue
 
         total_files += 1
         ext = p.suffix.lower() if p.suffix else "(no ext)"
         ext_counts[ext] += 1
         touched.append(str(p))
 
-        if ext in _CODE_EXTENSIONS:
-            try:
-                size_mb = p.stat().st_size / (1024 * 1024)
-                if size_mb > max_mb:
-                    continue
-                total_lines += len(p.read_text(encoding="utf-8", errors="replace").splitlines())
-            except OSError:
-                continue
+        if ext in _CODE_EXTENSIONS and size / (1024 * 1024) <= max_mb:
+            code_files.append(p)
+
+    # Counting is independent per file and IO-bound, so fan it out via
+    # scan_files, which runs small batches serially and larger ones on
+    # a per-call thread pool.
+    total_lines = sum(scan_files(_count_lines, code_files))
 
     parts: list[str] = [
         f"Repository: {target.name}",
@@ -2,11 +2,36 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
+from safeclaw.plugins._walk import collect_scannable, scan_files
 from safeclaw.policy import Policy
 from safeclaw.redaction import get_patterns
 
+
+def _combine_patterns() -> re.Pattern[bytes]:
+    """Combine all redaction patterns into one alternation bytes regex.
+
+    One combined pattern means one regex pass per file instead of one
+    per pattern type; the pattern name is recovered from the matched
+    named group. Per-pattern flags (IGNORECASE) are scoped inline so
+    they do not leak across alternatives. Compiled over bytes so files
+    can be scanned without UTF-8 decoding.
+    """
+    parts: list[str] = []
+    for name, regex in get_patterns():
+        pattern = regex.pattern
+        if regex.flags & re.IGNORECASE:
+            pattern = f"(?i:{pattern})"
+        parts.append(f"(?P<{name}>{pattern})")
+    return re.compile("|".join(parts).encode("ascii"))
+
+
+# Compiled once at import and reused across files and invocations.
+_COMBINED_RE = _combine_patterns()
+_PATTERN_NAMES: tuple[str, ...] = tuple(name for name, _ in get_patterns())
+
 # File extensions to scan for secrets.
 _SCANNABLE_EXTS: set[str] = {
     ".py",
@@ -25,19 +50,7 @@ _SCANNABLE_EXTS: set[str] = {
 }
 
 # Dotfiles matched by full name (Path.suffix is empty for these).
-_SCANNABLE_NAMES: set[str] = {".env", ".env.local", ".env.example"}
-
-
-def _is_scannable(path: Path, max_mb: int) -> bool:
-    """Return True if the file should be scanned."""
-    if not path.is_file():
-        return False
-    if path.suffix.lower() not in _SCANNABLE_EXTS and path.name.lower() not in _SCANNABLE_NAMES:
-        return False
-    try:
-        return path.stat().st_size / (1024 * 1024) <= max_mb
-    except OSError:
-        return False
+_SCANNABLE_NAMES: frozenset[str] = frozenset({".env", ".env.local", ".env.example"})
 
 
 def run(policy: Policy, target: Path) -> tuple[str, list[str]]:
@@ -53,35 +66,29 @@ def run(policy: Policy, target: Path) -> tuple[str, list[str]]:
     Returns:
         Report string and list of scanned file paths.
     """
-    max_mb = policy.limits.max_file_mb
-    max_files = policy.limits.max_files
-    patterns = get_patterns()
-
-    files_to_scan: list[Path] = []
-    if target.is_file():
-        if _is_scannable(target, max_mb):
-            files_to_scan.append(target)
-    else:
-        for p in sorted(target.rglob("*")):
-            if len(files_to_scan) >= max_files:
-                break
-            if _is_scannable(p, max_mb):
-                files_to_scan.append(p)
-
-    findings: list[str] = []
-    touched: list[str] = []
-
-    for fpath in files_to_scan:
-        touched.append(str(fpath))
+    files_to_scan = collect_scannable(
+        target,
+        policy.limits.max_file_mb,
+        policy.limits.max_files,
+        _SCANNABLE_EXTS,
+        _SCANNABLE_NAMES,
+    )
+
+    def _scan_one(fpath: Path) -> list[str]:
+        """Scan a single file, returning its formatted finding lines."""
         try:
-            content = fpath.read_text(encoding="utf-8", errors="replace")
+            content = fpath.read_bytes()
         except OSError:
-            continue
-
-        for name, regex in patterns:
-            if regex.search(content):
-                rel = fpath.relative_to(target) if target.is_dir() else fpath.name
-                findings.append(f"  {rel}: {name}")
+            return []
+        found = {m.lastgroup for m in _COMBINED_RE.finditer(content)}
+        if not found:
+            return []
+        rel = fpath.relative_to(target) if target.is_dir() else fpath.name
+        # Report in stable pattern order, not set order.
+        return [f"  {rel}: {name}" for name in _PATTERN_NAMES if name in found]
+
+    touched = [str(f) for f in files_to_scan]
+    findings = [f for per_file in scan_files(_scan_one, files_to_scan) for f in per_file]
 
     if findings:
         header = f"Found {len(findings)} potential secret(s) in {len(files_to_scan)} file(s):\n"
@@ -5,9 +5,18 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+from safeclaw.plugins._walk import collect_scannable, scan_files
 from safeclaw.policy import Policy
 
-_MARKER_RE = re.compile(r"\b(TODO|FIXME|HACK)\b", re.IGNORECASE)
+try:  # Optional fast path: RE2 matches with a DFA instead of backtracking.
+    import re2 as _re
+except ImportError:  # pragma: no cover - depends on installed extras
+    _re = re  # type: ignore[assignment]
+
+# Matches a whole line containing a marker; (?m) lets one finditer
+# call cover the entire file in a single C-level scan, so files and
+# lines without markers never turn into Python objects.
+_MARKER_LINE_RE = _re.compile(rb"(?im)^.*\b(TODO|FIXME|HACK)\b.*$")
 
 # File extensions considered "text" for scanning purposes.
 _TEXT_EXTENSIONS: set[str] = {
@@ -46,19 +55,6 @@ _TEXT_EXTENSIONS: set[str] = {
 }
 
 
-def _is_scannable(path: Path, max_mb: int) -> bool:
-    """Return True if the file should be scanned."""
-    if not path.is_file():
-        return False
-    if path.suffix.lower() not in _TEXT_EXTENSIONS:
-        return False
-    try:
-        size_mb = path.stat().st_size / (1024 * 1024)
-        return size_mb <= max_mb
-    except OSError:
-        return False
-
-
 def run(policy: Policy, target: Path) -> tuple[str, list[str]]:
     """Scan *target* for TODO/FIXME/HACK markers.
 
@@ -69,33 +65,36 @@ def run(policy: Policy, target: Path) -> tuple[str, list[str]]:
     Returns:
         Formatted results string and list of scanned file paths.
     """
-    max_mb = policy.limits.max_file_mb
-    max_files = policy.limits.max_files
-
-    files_to_scan: list[Path] = []
-    if target.is_file():
-        if _is_scannable(target, max_mb):
-            files_to_scan.append(target)
-    else:
-        for p in sorted(target.rglob("*")):
-            if len(files_to_scan) >= max_files:
-                break
-            if _is_scannable(p, max_mb):
-                files_to_scan.append(p)
-
-    matches: list[str] = []
-    touched: list[str] = []
+    files_to_scan = collect_scannable(
+        target, policy.limits.max_file_mb, policy.limits.max_files, _TEXT_EXTENSIONS
+    )
+    is_dir = target.is_dir()
 
-    for fpath in files_to_scan:
-        touched.append(str(fpath))
+    def _scan_one(fpath: Path) -> list[str]:
+        """Scan a single file, returning its formatted match lines."""
         try:
-            lines = fpath.read_text(encoding="utf-8", errors="replace").splitlines()
+            # Scan raw bytes; UTF-8 decoding is deferred to the rare
+            # matched line instead of paid for every file.
+            data = fpath.read_bytes()
         except OSError:
-            continue
-        for lineno, line in enumerate(lines, start=1):
-            if _MARKER_RE.search(line):
-                rel = fpath.relative_to(target) if target.is_dir() else fpath.name
-                matches.append(f"  {rel}:{lineno}: {line.strip()}")
+            return []
+        found: list[str] = []
+        rel: object = None
+        lineno = 1
+        prev = 0
+        for m in _MARKER_LINE_RE.finditer(data):
+            if rel is None:
+                rel = fpath.relative_to(target) if is_dir else fpath.name
+            # Line numbers advance by the newlines since the previous
+            # match — incremental counts, not an O(n) count per match.
+            lineno += data.count(b"\n", prev, m.start())
+            prev = m.start()
+            text = m.group(0).decode("utf-8", errors="replace").strip()
+            found.append(f"  {rel}:{lineno}: {text}")
+        return found
+
+    touched = [str(f) for f in files_to_scan]
+    matches = [m for per_file in scan_files(_scan_one, files_to_scan) for m in per_file]
 
     if matches:
         header = f"Found {len(matches)} marker(s) in {len(files_to_scan)} file(s):\n"
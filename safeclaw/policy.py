@@ -2,11 +2,41 @@
 
 from __future__ import annotations
 
+import json
+from functools import cached_property
 from pathlib import Path
 
 import yaml
 from pydantic import BaseModel, field_validator
 
+try:  # Optional fast path: orjson parses JSON policies far faster.
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
+# libyaml's C loader when available (~10x faster parse); SafeLoader
+# otherwise. Both refuse arbitrary object construction.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parse_policy_text(path: Path, raw: bytes) -> object:
+    """Parse policy file contents into plain Python data.
+
+    Works on raw bytes: every parser here (orjson, json, libyaml)
+    decodes UTF-8 internally in C, so there is no reason to pay for a
+    TextIOWrapper decode up front. JSON is a YAML subset, so a .json
+    policy (or one that starts with a brace/bracket) is routed through
+    the much faster JSON parser first; anything the JSON parser rejects
+    — e.g. YAML flow style with unquoted keys — falls back to the YAML
+    loader.
+    """
+    if path.suffix == ".json" or raw.lstrip().startswith((b"{", b"[")):
+        try:
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError:
+            pass
+    return yaml.load(raw, Loader=_YAML_LOADER)
+
 
 class Limits(BaseModel):
     """Resource limits for plugin execution."""
@@ -26,6 +56,7 @@ class PlannerConfig(BaseModel):
     api_key_env: str = ""
     max_steps: int = 5
     require_confirmation: bool = True
+    parallel: bool = False
 
 
 class DashboardConfig(BaseModel):
@@ -56,26 +87,90 @@ class Policy(BaseModel):
     @classmethod
     def _deduplicate_plugins(cls, v: list[str]) -> list[str]:
         """Remove duplicate plugin names while preserving order."""
-        seen: set[str] = set()
-        result: list[str] = []
-        for name in v:
-            if name not in seen:
-                seen.add(name)
-                result.append(name)
-        return result
+        # dict preserves insertion order, so this is the C-level
+        # ordered-set idiom — one pass, no Python-level loop.
+        return list(dict.fromkeys(v))
+
+    @cached_property
+    def _allowed_set(self) -> frozenset[str]:
+        """Allowed plugins as a frozenset for O(1) membership checks."""
+        return frozenset(self.allowed_plugins)
+
+    @cached_property
+    def _resolved_root(self) -> Path:
+        # resolve() walks the path with syscalls; the root is fixed for
+        # the lifetime of a Policy, so pay that once.
+        return Path(self.project_root).resolve()
 
     def root_path(self) -> Path:
         """Return the resolved project root path."""
-        return Path(self.project_root).resolve()
+        return self._resolved_root
+
+    @cached_property
+    def _resolved_sandbox(self) -> Path:
+        return self._resolved_root / self.sandbox_subdir
 
     def sandbox_path(self) -> Path:
         """Return the resolved sandbox directory path."""
-        return self.root_path() / self.sandbox_subdir
+        return self._resolved_sandbox
+
+
+# Parsed policies keyed by resolved path; the value records the mtime
+# and size the parse is valid for. Long-lived processes (dashboard,
+# planner loops) call load_policy repeatedly while the file rarely
+# changes, so a fresh stat is all an unchanged file costs. Bounded so
+# processes that load many distinct policy files cannot grow it.
+_POLICY_CACHE: dict[Path, tuple[int, int, Policy]] = {}
+_POLICY_CACHE_MAX = 8
+
+
+def clear_policy_cache() -> None:
+    """Drop all cached parsed policies (mainly for tests)."""
+    _POLICY_CACHE.clear()
+
+
+def load_policy_header(path: Path | str = "policy.yaml") -> dict[str, object]:
+    """Read only the top-level scalar keys of a policy file.
+
+    Commands that just need a routing decision (project root, network
+    flag, …) can skip constructing the nested sections: the document is
+    composed once and only scalar-valued root keys are built into
+    Python objects, so ``limits``/``planner``/``dashboard`` subtrees are
+    never materialized.
+
+    Args:
+        path: Path to the YAML policy file.
+
+    Returns:
+        Mapping of top-level key name to scalar value.
+
+    Raises:
+        FileNotFoundError: If the policy file does not exist.
+    """
+    policy_path = Path(path)
+    if not policy_path.exists():
+        raise FileNotFoundError(f"Policy file not found: {policy_path}")
+
+    loader = _YAML_LOADER(policy_path.read_bytes())
+    try:
+        node = loader.get_single_node()
+        header: dict[str, object] = {}
+        if isinstance(node, yaml.MappingNode):
+            for key_node, value_node in node.value:
+                if isinstance(value_node, yaml.ScalarNode):
+                    header[loader.construct_object(key_node)] = loader.construct_object(value_node)
+        return header
+    finally:
+        loader.dispose()
 
 
 def load_policy(path: Path | str = "policy.yaml") -> Policy:
     """Load and validate a policy file.
 
+    Results are cached per file and reused until the file's mtime or
+    size changes, so repeated calls skip the YAML parse and pydantic
+    validation. Callers must not mutate the returned instance.
+
     Args:
         path: Path to the YAML policy file.
 
@@ -90,12 +185,21 @@ def load_policy(path: Path | str = "policy.yaml") -> Policy:
     if not policy_path.exists():
         raise FileNotFoundError(f"Policy file not found: {policy_path}")
 
-    text = policy_path.read_text(encoding="utf-8")
-    data = yaml.safe_load(text)
+    resolved = policy_path.resolve()
+    st = resolved.stat()
+    cached = _POLICY_CACHE.get(resolved)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    data = _parse_policy_text(policy_path, policy_path.read_bytes())
 
     if data is None:
         raise ValueError(f"Policy file is empty: {policy_path}")
     if not isinstance(data, dict):
         raise ValueError(f"Policy file must contain a YAML mapping: {policy_path}")
 
-    return Policy(**data)
+    policy = Policy(**data)
+    if len(_POLICY_CACHE) >= _POLICY_CACHE_MAX and resolved not in _POLICY_CACHE:
+        _POLICY_CACHE.pop(next(iter(_POLICY_CACHE)))
+    _POLICY_CACHE[resolved] = (st.st_mtime_ns, st.st_size, policy)
+    return policy
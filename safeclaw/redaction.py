@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import re
+from collections.abc import Iterator
 
 # Each pattern: (name, compiled regex)
 _PATTERNS: list[tuple[str, re.Pattern[str]]] = [
@@ -22,6 +24,89 @@ _PATTERNS: list[tuple[str, re.Pattern[str]]] = [
 ]
 
 
+# Literal prefixes that every pattern above must contain. If none of
+# these occur in the text, no pattern can match and the full alternation
+# is never invoked. A single case-insensitive literal alternation scans
+# the input once (the engine's fast literal search) without the full
+# str.lower() copy a substring loop would need — clean text is the
+# common case, since redact() runs on every audit event.
+_ANCHOR_RE = re.compile(r"sk-|AKIA|ghp_|github_pat_|Bearer|-----BEGIN", re.IGNORECASE)
+
+
+@functools.cache
+def _build_combined(names: tuple[str, ...]) -> re.Pattern[str]:
+    """Combine the named patterns into one alternation with named groups.
+
+    One combined pattern means a single pass over the input instead of
+    one full scan per pattern type; the marker name is recovered from
+    the matched group. Per-pattern flags (IGNORECASE on BEARER_TOKEN)
+    are scoped inline so they do not leak across alternatives.
+    Alternatives keep list order, so more specific patterns still win
+    at the same position. Memoized so callers wanting a pattern subset
+    (e.g. everything but BEARER_TOKEN) compile it at most once.
+    """
+    parts: list[str] = []
+    for name, regex in _PATTERNS:
+        if name not in names:
+            continue
+        pattern = regex.pattern
+        if regex.flags & re.IGNORECASE:
+            pattern = f"(?i:{pattern})"
+        parts.append(f"(?P<{name}>{pattern})")
+    return re.compile("|".join(parts))
+
+
+_COMBINED_RE = _build_combined(tuple(name for name, _ in _PATTERNS))
+
+# redact() handles PEM blocks with literal string search instead of the
+# lazy [\s\S]*? regex, which walks the NFA char-by-char between BEGIN
+# and END markers; str.find uses CPython's vectorized two-way search
+# and carries no backtracking risk on malformed input.
+_REDACT_RE = _build_combined(tuple(name for name, _ in _PATTERNS if name != "PRIVATE_KEY"))
+
+# Replacement labels built once; the sub callback would otherwise
+# allocate the same f-string for every match.
+_LABELS: dict[str, str] = {name: f"[REDACTED:{name}]" for name, _ in _PATTERNS}
+
+_PEM_VARIANTS = ("", "RSA ", "EC ", "DSA ")
+_PEM_HEADERS = tuple(f"-----BEGIN {v}PRIVATE KEY-----" for v in _PEM_VARIANTS)
+_PEM_FOOTERS = tuple(f"-----END {v}PRIVATE KEY-----" for v in _PEM_VARIANTS)
+
+
+def _redact_private_keys(text: str) -> str:
+    """Replace PEM private-key blocks using literal substring search."""
+    pos = text.find("-----BEGIN ")
+    if pos == -1:
+        return text
+
+    out: list[str] = []
+    last = 0
+    while pos != -1:
+        header = next((h for h in _PEM_HEADERS if text.startswith(h, pos)), None)
+        if header is None:
+            pos = text.find("-----BEGIN ", pos + 1)
+            continue
+
+        # Like the lazy regex, close at the earliest matching footer.
+        end = text.find("-----END ", pos + len(header))
+        footer = None
+        while end != -1:
+            footer = next((f for f in _PEM_FOOTERS if text.startswith(f, end)), None)
+            if footer is not None:
+                break
+            end = text.find("-----END ", end + 1)
+        if footer is None:
+            break
+
+        out.append(text[last:pos])
+        out.append(_LABELS["PRIVATE_KEY"])
+        last = end + len(footer)
+        pos = text.find("-----BEGIN ", last)
+
+    out.append(text[last:])
+    return "".join(out)
+
+
 def redact(text: str) -> str:
     """Replace sensitive patterns in *text* with redaction markers.
 
@@ -32,9 +117,21 @@ def redact(text: str) -> str:
         A copy of *text* with each secret replaced by
         ``[REDACTED:PATTERN_NAME]``.
     """
-    for name, pattern in _PATTERNS:
-        text = pattern.sub(f"[REDACTED:{name}]", text)
-    return text
+    if _ANCHOR_RE.search(text) is None:
+        return text
+
+    text = _redact_private_keys(text)
+    return _REDACT_RE.sub(lambda m: _LABELS[m.lastgroup or ""], text)
+
+
+def iter_matches(text: str) -> Iterator[tuple[str, int, int]]:
+    """Yield ``(pattern_name, start, end)`` for every secret in *text*.
+
+    One C-level pass over the combined alternation, for callers that
+    need match positions rather than a redacted copy.
+    """
+    for m in _COMBINED_RE.finditer(text):
+        yield m.lastgroup or "", m.start(), m.end()
 
 
 def get_pattern_names() -> list[str]:
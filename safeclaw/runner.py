@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from safeclaw.audit import AuditEvent, write_audit
+from safeclaw.plugins import deps_audit, log_summarize, repo_stats, secrets_scan, todo_scan
 from safeclaw.policy import Policy
 
 
-@dataclass
+@dataclass(slots=True)
 class RunResult:
     """Result of a plugin execution."""
 
@@ -18,32 +21,20 @@ class RunResult:
     touched_files: list[str] = field(default_factory=list)
 
 
-# Plugin registry: maps plugin names to their run functions.
-# Populated at import time by _register_builtins().
-_PLUGIN_REGISTRY: dict[str, object] = {}
-
-
-def _register_builtins() -> None:
-    """Lazily import and register all built-in plugins."""
-    if _PLUGIN_REGISTRY:
-        return
-
-    from safeclaw.plugins import deps_audit, log_summarize, repo_stats, secrets_scan, todo_scan
-
-    _PLUGIN_REGISTRY.update(
-        {
-            "todo_scan": todo_scan.run,
-            "log_summarize": log_summarize.run,
-            "secrets_scan": secrets_scan.run,
-            "deps_audit": deps_audit.run,
-            "repo_stats": repo_stats.run,
-        }
-    )
+# Plugin registry: maps plugin names to their run functions. Built
+# eagerly at import — the CLI only imports the runner when a command
+# actually executes, so nothing is paid at --help time.
+_PLUGIN_REGISTRY: dict[str, object] = {
+    "todo_scan": todo_scan.run,
+    "log_summarize": log_summarize.run,
+    "secrets_scan": secrets_scan.run,
+    "deps_audit": deps_audit.run,
+    "repo_stats": repo_stats.run,
+}
 
 
 def get_registry() -> dict[str, object]:
-    """Return the plugin registry, initialising if needed."""
-    _register_builtins()
+    """Return the plugin registry."""
     return _PLUGIN_REGISTRY
 
 
@@ -65,71 +56,48 @@ def run_plugin(policy: Policy, plugin_name: str, target_path: Path | str) -> Run
     """
     root = policy.root_path()
 
-    # --- Policy checks ---
-    if plugin_name not in policy.allowed_plugins:
-        msg = f"Plugin '{plugin_name}' is not in the allowed list"
+    def _emit(status: str, detail: str, touched: list[str] | None = None) -> None:
         write_audit(
             root,
             AuditEvent(
                 action=plugin_name,
-                status="denied",
-                detail=msg,
+                status=status,
+                detail=detail,
+                touched_files=touched or [],
             ),
         )
+
+    # --- Policy checks (cheapest first; the target is only resolved —
+    # a filesystem operation — once the plugin itself is permitted) ---
+    if plugin_name not in policy._allowed_set:
+        msg = f"Plugin '{plugin_name}' is not in the allowed list"
+        _emit("denied", msg)
         return RunResult(ok=False, message=msg)
 
     registry = get_registry()
     if plugin_name not in registry:
         msg = f"Plugin '{plugin_name}' is not registered"
-        write_audit(
-            root,
-            AuditEvent(
-                action=plugin_name,
-                status="error",
-                detail=msg,
-            ),
-        )
+        _emit("error", msg)
         return RunResult(ok=False, message=msg)
 
+    # resolve() is kept unconditionally: a path that is already absolute
+    # and ".."-free can still be (or contain) a symlink escaping the
+    # root, and path enforcement is this function's security boundary.
     target = Path(target_path).resolve()
-    try:
-        target.relative_to(root)
-    except ValueError:
+    if not target.is_relative_to(root):
         msg = f"Target path '{target}' is outside project root '{root}'"
-        write_audit(
-            root,
-            AuditEvent(
-                action=plugin_name,
-                status="denied",
-                detail=msg,
-            ),
-        )
+        _emit("denied", msg)
         return RunResult(ok=False, message=msg)
 
     # --- Execute plugin ---
     try:
         run_fn = registry[plugin_name]
         message, touched_files = run_fn(policy, target)  # type: ignore[operator]
-        write_audit(
-            root,
-            AuditEvent(
-                action=plugin_name,
-                status="ok",
-                detail=message,
-                touched_files=touched_files,
-            ),
-        )
+        _emit("ok", message, touched_files)
         return RunResult(ok=True, message=message, touched_files=touched_files)
     except Exception as exc:
         msg = f"Plugin '{plugin_name}' raised an exception: {exc}"
-        write_audit(
-            root,
-            AuditEvent(
-                action=plugin_name,
-                status="error",
-                detail=msg,
-            ),
-        )
+        _emit("error", msg)
         return RunResult(ok=False, message=msg)
 
 
@@ -152,3 +120,46 @@ def run_plan(policy: Policy, plan: object) -> list[RunResult]:
         if not result.ok:
             break
     return results
+
+
+def run_plan_parallel(policy: Policy, plan: object) -> list[RunResult]:
+    """Execute plan steps concurrently in a thread pool.
+
+    Plugin runs are I/O-bound file scans, so overlapping them drops
+    wall time towards the slowest step. On the first failure, pending
+    (not yet started) steps are cancelled; steps already running finish
+    normally. Results keep step order, but unlike :func:`run_plan` a
+    step after a failed one may have executed. Opt in via
+    ``planner.parallel`` in policy.yaml.
+
+    Args:
+        policy: The active security policy.
+        plan: A validated ExecutionPlan (from planner module).
+
+    Returns:
+        List of RunResult for each executed step, in step order.
+    """
+    steps = list(plan.steps)  # type: ignore[attr-defined]
+    if not steps:
+        return []
+
+    results: list[RunResult | None] = [None] * len(steps)
+    max_workers = min(len(steps), os.cpu_count() or 1)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(run_plugin, policy, step.plugin, step.target): i
+            for i, step in enumerate(steps)
+        }
+        for future in as_completed(futures):
+            # Futures cancelled below still come out of as_completed;
+            # asking them for a result would raise CancelledError.
+            if future.cancelled():
+                continue
+            result = future.result()
+            results[futures[future]] = result
+            if not result.ok:
+                for pending in futures:
+                    pending.cancel()
+
+    return [r for r in results if r is not None]
@@ -3,7 +3,7 @@
 import json
 from pathlib import Path
 
-from safeclaw.audit import AuditEvent, read_audit, write_audit
+from safeclaw.audit import AuditEvent, read_audit, read_audit_cached, write_audit
 
 
 class TestAudit:
@@ -40,6 +40,21 @@ class TestAudit:
         assert entries[0]["action"] == "step4"
         assert entries[2]["action"] == "step2"
 
+    def test_read_audit_cached_matches_read_audit(self, tmp_path: Path) -> None:
+        for i in range(5):
+            write_audit(tmp_path, AuditEvent(action=f"step{i}", status="ok"))
+        assert read_audit_cached(tmp_path, last_n=3) == read_audit(tmp_path, last_n=3)
+
+    def test_read_audit_cached_sees_appends(self, tmp_path: Path) -> None:
+        write_audit(tmp_path, AuditEvent(action="first", status="ok"))
+        read_audit_cached(tmp_path, last_n=5)
+        write_audit(tmp_path, AuditEvent(action="second", status="ok"))
+        entries = read_audit_cached(tmp_path, last_n=5)
+        assert entries[0]["action"] == "second"
+
+    def test_read_audit_cached_missing_file(self, tmp_path: Path) -> None:
+        assert read_audit_cached(tmp_path) == []
+
     def test_touched_files_recorded(self, tmp_path: Path) -> None:
         write_audit(
             tmp_path,
@@ -63,6 +63,17 @@ class TestDashboardEndpoints:
         assert resp.status_code == 200
         assert "Audit" in resp.text
 
+    def test_audit_fields_escaped(self, client: TestClient, dashboard_policy: Policy) -> None:
+        from safeclaw.audit import AuditEvent, write_audit
+
+        write_audit(
+            dashboard_policy.root_path(),
+            AuditEvent(action="scan", status="ok", detail="<script>alert(1)</script>"),
+        )
+        resp = client.get("/audit")
+        assert "<script>alert(1)</script>" not in resp.text
+        assert "&lt;script&gt;" in resp.text
+
     def test_policy_page(self, client: TestClient) -> None:
         resp = client.get("/policy")
         assert resp.status_code == 200
@@ -26,9 +26,9 @@ from safeclaw.policy import PlannerConfig, Policy
 
 
 @pytest.fixture()
-def planner_policy(tmp_path: Path) -> Policy:
+def planner_policy(make_policy, tmp_path: Path) -> Policy:
     """Policy with planner enabled and Ollama localhost backend."""
-    return Policy(
+    return make_policy(
         project_root=str(tmp_path),
         allow_network=False,
         allowed_plugins=["todo_scan", "secrets_scan", "repo_stats"],
@@ -301,6 +301,24 @@ class TestPlannerWithMockedBackend:
         assert len(plan.steps) == 3
         assert [s.plugin for s in plan.steps] == ["todo_scan", "secrets_scan", "repo_stats"]
 
+    def test_plan_many_keeps_task_order(
+        self, planner_policy: Policy, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """plan_many returns one plan per task, in task order."""
+        import asyncio
+
+        async def mock_acall(self, policy, system, user_msg, client):  # noqa: ARG001
+            plugin = "todo_scan" if "todo" in user_msg else "repo_stats"
+            return f'{{"steps": [{{"plugin": "{plugin}", "target": "./", "reason": "r"}}]}}'
+
+        from safeclaw.planner import _OllamaBackend
+
+        monkeypatch.setattr(_OllamaBackend, "acall", mock_acall)
+
+        planner = Planner(planner_policy)
+        plans = asyncio.run(planner.plan_many(["find todos", "gather stats"]))
+        assert [p.steps[0].plugin for p in plans] == ["todo_scan", "repo_stats"]
+
 
 class TestUnknownBackend:
     def test_unknown_backend_raises(self, tmp_path: Path) -> None:
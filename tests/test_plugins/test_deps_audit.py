@@ -15,9 +15,9 @@ from safeclaw.policy import Policy
 
 
 @pytest.fixture()
-def deps_policy(tmp_path: Path) -> Policy:
+def deps_policy(make_policy, tmp_path: Path) -> Policy:
     """Policy rooted at tmp_path with deps_audit allowed."""
-    return Policy(
+    return make_policy(
         project_root=str(tmp_path),
         allowed_plugins=["deps_audit"],
     )
@@ -11,9 +11,9 @@ from safeclaw.policy import Limits, Policy
 
 
 @pytest.fixture()
-def stats_policy(tmp_path: Path) -> Policy:
+def stats_policy(make_policy, tmp_path: Path) -> Policy:
     """Policy rooted at tmp_path with repo_stats allowed."""
-    return Policy(
+    return make_policy(
         project_root=str(tmp_path),
         allowed_plugins=["repo_stats"],
     )
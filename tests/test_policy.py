@@ -4,7 +4,23 @@ from pathlib import Path
 
 import pytest
 
-from safeclaw.policy import DashboardConfig, PlannerConfig, Policy, load_policy
+from safeclaw.policy import (
+    DashboardConfig,
+    PlannerConfig,
+    Policy,
+    load_policy,
+    load_policy_header,
+)
+
+# Policy file contents used by TestLoadPolicy, pre-encoded once so each
+# test does a single write_bytes instead of re-encoding per call.
+_POLICY_MINIMAL = b"project_root: .\n"
+_POLICY_BASIC = b"project_root: .\nallow_network: false\nallowed_plugins:\n  - todo_scan\n"
+_POLICY_NETWORK = b"project_root: .\nallow_network: true\n"
+_POLICY_PLANNER = b"project_root: .\nplanner:\n  enabled: true\n  backend: openai\n"
+_POLICY_DASHBOARD = b"project_root: .\ndashboard:\n  enabled: true\n  port: 9999\n"
+_POLICY_WITH_LIMITS = b"project_root: .\nallow_network: true\nlimits:\n  max_file_mb: 9\n"
+_POLICY_JSON = b'{"project_root": ".", "allowed_plugins": ["todo_scan"]}'
 
 
 class TestPolicyModel:
@@ -56,10 +72,7 @@ class TestPolicyModel:
 class TestLoadPolicy:
     def test_load_valid_policy(self, tmp_path: Path) -> None:
         policy_file = tmp_path / "policy.yaml"
-        policy_file.write_text(
-            "project_root: .\nallow_network: false\nallowed_plugins:\n  - todo_scan\n",
-            encoding="utf-8",
-        )
+        policy_file.write_bytes(_POLICY_BASIC)
         p = load_policy(policy_file)
         assert p.allow_network is False
         assert "todo_scan" in p.allowed_plugins
@@ -70,39 +83,58 @@ class TestLoadPolicy:
 
     def test_empty_file_raises(self, tmp_path: Path) -> None:
         policy_file = tmp_path / "policy.yaml"
-        policy_file.write_text("", encoding="utf-8")
+        policy_file.write_bytes(b"")
         with pytest.raises(ValueError, match="empty"):
             load_policy(policy_file)
 
     def test_invalid_yaml_raises(self, tmp_path: Path) -> None:
         policy_file = tmp_path / "policy.yaml"
-        policy_file.write_text("just a string", encoding="utf-8")
+        policy_file.write_bytes(b"just a string")
         with pytest.raises(ValueError, match="mapping"):
             load_policy(policy_file)
 
     def test_load_without_planner_section(self, tmp_path: Path) -> None:
         policy_file = tmp_path / "policy.yaml"
-        policy_file.write_text("project_root: .\n", encoding="utf-8")
+        policy_file.write_bytes(_POLICY_MINIMAL)
         p = load_policy(policy_file)
         assert p.planner.enabled is False
         assert p.dashboard.enabled is False
 
     def test_load_with_planner_section(self, tmp_path: Path) -> None:
         policy_file = tmp_path / "policy.yaml"
-        policy_file.write_text(
-            "project_root: .\nplanner:\n  enabled: true\n  backend: openai\n",
-            encoding="utf-8",
-        )
+        policy_file.write_bytes(_POLICY_PLANNER)
         p = load_policy(policy_file)
         assert p.planner.enabled is True
         assert p.planner.backend == "openai"
 
+    def test_load_policy_header_scalars_only(self, tmp_path: Path) -> None:
+        policy_file = tmp_path / "policy.yaml"
+        policy_file.write_bytes(_POLICY_WITH_LIMITS)
+        header = load_policy_header(policy_file)
+        assert header["project_root"] == "."
+        assert header["allow_network"] is True
+        assert "limits" not in header
+
+    def test_load_json_policy(self, tmp_path: Path) -> None:
+        policy_file = tmp_path / "policy.json"
+        policy_file.write_bytes(_POLICY_JSON)
+        p = load_policy(policy_file)
+        assert p.allowed_plugins == ["todo_scan"]
+
+    def test_load_is_cached_until_file_changes(self, tmp_path: Path) -> None:
+        policy_file = tmp_path / "policy.yaml"
+        policy_file.write_bytes(_POLICY_MINIMAL)
+        first = load_policy(policy_file)
+        assert load_policy(policy_file) is first
+
+        policy_file.write_bytes(_POLICY_NETWORK)
+        updated = load_policy(policy_file)
+        assert updated is not first
+        assert updated.allow_network is True
+
     def test_load_with_dashboard_section(self, tmp_path: Path) -> None:
         policy_file = tmp_path / "policy.yaml"
-        policy_file.write_text(
-            "project_root: .\ndashboard:\n  enabled: true\n  port: 9999\n",
-            encoding="utf-8",
-        )
+        policy_file.write_bytes(_POLICY_DASHBOARD)
         p = load_policy(policy_file)
         assert p.dashboard.enabled is True
         assert p.dashboard.port == 9999
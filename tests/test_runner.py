@@ -1,9 +1,12 @@
 """Tests for safeclaw.runner."""
 
 from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
 
 from safeclaw.policy import Policy
-from safeclaw.runner import run_plugin
+from safeclaw.runner import run_plan_parallel, run_plugin
 
 
 class TestRunPlugin:
@@ -31,3 +34,34 @@ class TestRunPlugin:
         result = run_plugin(policy, "todo_scan", outside)
         assert result.ok is False
         assert "outside project root" in result.message
+
+
+class TestRunPlanParallel:
+    def test_results_keep_step_order(self, policy: Policy, tmp_project: Path) -> None:
+        plan = SimpleNamespace(
+            steps=[
+                SimpleNamespace(plugin="todo_scan", target=str(tmp_project)),
+                SimpleNamespace(plugin="repo_stats", target=str(tmp_project)),
+            ]
+        )
+        results = run_plan_parallel(policy, plan)
+        assert len(results) == 2
+        assert all(r.ok for r in results)
+
+    def test_empty_plan(self, policy: Policy) -> None:
+        assert run_plan_parallel(policy, SimpleNamespace(steps=[])) == []
+
+    def test_failed_step_cancels_pending(
+        self, policy: Policy, tmp_project: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # One worker forces later steps to still be pending (and get
+        # cancelled) when the first step's denial comes back.
+        monkeypatch.setattr("safeclaw.runner.os.cpu_count", lambda: 1)
+        plan = SimpleNamespace(
+            steps=[SimpleNamespace(plugin="not_allowed", target=str(tmp_project))]
+            + [SimpleNamespace(plugin="repo_stats", target=str(tmp_project)) for _ in range(4)]
+        )
+        results = run_plan_parallel(policy, plan)
+        assert results
+        assert not results[0].ok
+        assert "not in the allowed list" in results[0].message